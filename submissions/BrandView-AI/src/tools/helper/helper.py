@@ -1,40 +1,52 @@
 import os
+import json
 import yt_dlp
 import re
-from typing import Dict, List, Union, Tuple, Literal
+from typing import Dict, Iterable, List, Optional, Union, Tuple, Literal
 from googleapiclient.errors import HttpError
 from googleapiclient.discovery import build
 from dotenv import load_dotenv
 import numpy as np
-from scipy import stats
-from textblob import TextBlob
+import pandas as pd
+from scipy.special import ndtri
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import logging
+import time
+import threading
+import functools
+from urllib.parse import unquote
+from collections import Counter
 import requests
-from io import BytesIO
-from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import cv2
 import torch
+from torchvision.io import decode_image, decode_jpeg, ImageReadMode
+from torchvision.transforms import v2
 from transformers import CLIPProcessor, CLIPModel
 
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
+from openai import OpenAI as OpenAIClient
 
-import whisper
-import tempfile
+from faster_whisper import WhisperModel
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 from agno.tools import tool
 from typing import Annotated
 
 from firecrawl import FirecrawlApp, ScrapeOptions
+from pydantic import BaseModel, Field
 
 # ─── Logging setup ─────────────────────────────────────────────────────────────
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize CLIP model and processor globally
+# CLIP is loaded lazily on first use; see _get_clip()
 CLIP_MODEL_NAME = "openai/clip-vit-large-patch14"
-logger.info(f"Loading CLIP model {CLIP_MODEL_NAME}…")
-model = CLIPModel.from_pretrained(CLIP_MODEL_NAME)
-processor = CLIPProcessor.from_pretrained(CLIP_MODEL_NAME)
+DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+DTYPE = torch.float16 if DEVICE == "cuda" else torch.float32
 
 # Global parameters for thumbnail analysis
 TEMPERATURE = 0.07
@@ -56,14 +68,155 @@ NEGATIVE_PROMPTS = [
     "cluttered layout"
 ]
 
-def _download_image(url: str) -> Image.Image:
-    resp = requests.get(url, timeout=5)
+# CLIPProcessor's resize / center crop / normalize, as tensor ops that run on the GPU
+CLIP_MEAN = [0.48145466, 0.4578275, 0.40821073]
+CLIP_STD = [0.26862954, 0.26130258, 0.27577711]
+_gpu_transform = v2.Compose([
+    v2.ToDtype(torch.float32, scale=True),
+    v2.Resize(224, interpolation=v2.InterpolationMode.BICUBIC, antialias=True),
+    v2.CenterCrop(224),
+    v2.Normalize(mean=CLIP_MEAN, std=CLIP_STD)
+])
+
+# Fixed batch shapes for the compiled image tower on CUDA; larger batches run in chunks
+CLIP_BATCH_SIZES = (1, 4, 8, 16)
+
+_clip = None
+_clip_lock = threading.Lock()
+
+def _load_clip() -> Tuple:
+    logger.info(f"Loading CLIP model {CLIP_MODEL_NAME}…")
+    model = CLIPModel.from_pretrained(CLIP_MODEL_NAME).to(DEVICE, dtype=DTYPE).eval()
+    processor = CLIPProcessor.from_pretrained(CLIP_MODEL_NAME)
+
+    # Precompute the normalized prompt embeddings once; they never change between thumbnails
+    with torch.inference_mode():
+        text_inputs = processor(
+            text=POSITIVE_PROMPTS + NEGATIVE_PROMPTS,
+            return_tensors="pt",
+            padding=True
+        )
+        txt_feats = model.get_text_features(**text_inputs.to(DEVICE))
+        txt_feats = txt_feats / txt_feats.norm(dim=-1, keepdim=True)
+        # Reduction weights: mean over positive prompts minus mean over negative prompts.
+        # Built here rather than at import so importing never touches the GPU.
+        prompt_weights = torch.cat([
+            torch.full((len(POSITIVE_PROMPTS),), 1.0 / len(POSITIVE_PROMPTS)),
+            torch.full((len(NEGATIVE_PROMPTS),), -1.0 / len(NEGATIVE_PROMPTS))
+        ]).to(DEVICE, dtype=DTYPE)
+        # sigmoid(SCALE * ((img @ txt.T) / TEMPERATURE) @ w) == sigmoid(img @ v), so fold the
+        # prompt matmul, mean difference, temperature and scale into one (D,) vector
+        score_direction = txt_feats.T @ (prompt_weights * (SCALE / TEMPERATURE))
+
+    if DEVICE == "cuda":
+        # Inputs are always 3x224x224 and batches are padded to CLIP_BATCH_SIZES, so only
+        # a handful of static-shape graphs are ever compiled and captured
+        image_features = torch.compile(model.get_image_features, mode="reduce-overhead", dynamic=False)
+    else:
+        # Post-training dynamic INT8 quantization of the Linear layers; only the image tower
+        # runs per thumbnail now, so this shrinks the weights ~4x and uses int8 GEMM on CPU
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        image_features = model.get_image_features
+
+    return processor, image_features, txt_feats, score_direction
+
+def _padded_image_features(image_features, pixel_values: torch.Tensor) -> torch.Tensor:
+    """
+    Run the image tower on chunks zero-padded up to the nearest CLIP_BATCH_SIZES entry, so a new
+    batch size never triggers a recompile, and return the features for the real rows only.
+    """
+    max_batch = CLIP_BATCH_SIZES[-1]
+    features = []
+    for start in range(0, pixel_values.shape[0], max_batch):
+        chunk = pixel_values[start:start + max_batch]
+        n = chunk.shape[0]
+        size = next(size for size in CLIP_BATCH_SIZES if size >= n)
+        if size > n:
+            chunk = torch.cat([chunk, chunk.new_zeros((size - n, *chunk.shape[1:]))])
+        # Clone: CUDA graph outputs are overwritten by the next replay
+        features.append(image_features(chunk)[:n].clone())
+    return torch.cat(features)
+
+def _get_clip() -> Tuple:
+    """
+    Return (processor, image_features, txt_feats, score_direction), loading CLIP on first use so that
+    importing this module stays cheap for callers that never score thumbnails.
+    """
+    global _clip
+    if _clip is None:
+        with _clip_lock:
+            if _clip is None:
+                _clip = _load_clip()
+    return _clip
+
+# Shared HTTP session so thumbnail downloads reuse pooled TCP/TLS connections
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    # Retry throttling and transient CDN errors; the last response still reaches raise_for_status
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+))
+
+def _download_image_bytes(url: str) -> bytes:
+    resp = _session.get(url, timeout=5)
     resp.raise_for_status()
-    return Image.open(BytesIO(resp.content)).convert("RGB")
+    return resp.content
+
+def _decode_thumbnail(data: bytes) -> np.ndarray:
+    """
+    Decode with OpenCV and resize the shortest side to 224 then center crop, returning (224, 224, 3) RGB uint8.
+    """
+    img = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if img is None:
+        raise ValueError("Could not decode thumbnail image")
+    h, w = img.shape[:2]
+    scale = 224 / min(h, w)
+    # INTER_AREA is the antialiased choice when shrinking, matching CLIP's bicubic+antialias
+    interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_CUBIC
+    img = cv2.resize(img, (max(224, round(w * scale)), max(224, round(h * scale))), interpolation=interpolation)
+    h, w = img.shape[:2]
+    top, left = (h - 224) // 2, (w - 224) // 2
+    return cv2.cvtColor(img[top:top + 224, left:left + 224], cv2.COLOR_BGR2RGB)
+
+_CLIP_MEAN_255 = np.array(CLIP_MEAN, dtype=np.float32) * 255
+_CLIP_INV_STD_255 = 1 / (np.array(CLIP_STD, dtype=np.float32) * 255)
+
+def _cpu_pixel_values(images: List[np.ndarray]) -> torch.Tensor:
+    """
+    Normalize a batch of decoded thumbnails in one vectorized pass, returning (N, 3, 224, 224).
+    """
+    batch = np.stack(images).astype(np.float32)
+    batch -= _CLIP_MEAN_255
+    batch *= _CLIP_INV_STD_255
+    return torch.from_numpy(np.ascontiguousarray(batch.transpose(0, 3, 1, 2)))
+
+def _gpu_pixel_values(images_data: List[bytes]) -> torch.Tensor:
+    """
+    Decode thumbnails with nvJPEG and preprocess them on the GPU, returning (N, 3, 224, 224).
+    """
+    buffers = [torch.frombuffer(bytearray(data), dtype=torch.uint8) for data in images_data]
+    try:
+        images = decode_jpeg(buffers, mode=ImageReadMode.RGB, device=DEVICE)
+    except RuntimeError:
+        # Not every thumbnail is a JPEG (e.g. WebP); decode the batch on the CPU instead
+        images = [decode_image(buffer, mode=ImageReadMode.RGB).to(DEVICE, non_blocking=True) for buffer in buffers]
+    return torch.stack([_gpu_transform(image) for image in images]).to(DTYPE)
+
+# VADER's lexicon analyzer is built once and reused for every text
+_sentiment_analyzer = SentimentIntensityAnalyzer()
+
+@functools.lru_cache(maxsize=10_000)
+def _score_single(text: str) -> float:
+    # Reposted and duplicate comments are common, so repeated texts are a dict lookup
+    return _sentiment_analyzer.polarity_scores(text)["compound"]
+
+def _sentiment_sum(text_counts: Iterable[Tuple[str, int]]) -> float:
+    return sum(_score_single(text) * count for text, count in text_counts)
 
 def _sentiment_score(texts: Union[str, List[str]]) -> float:
     """
-    Calculate the average sentiment score for a single text or a list of texts using TextBlob.
+    Calculate the average sentiment score for a single text or a list of texts using VADER.
     The sentiment score ranges from -1.0 (most negative) to 1.0 (most positive).
     """
     # Normalize input to list
@@ -72,56 +225,103 @@ def _sentiment_score(texts: Union[str, List[str]]) -> float:
     if not texts:
         raise ValueError("Input text or list of texts cannot be empty")
         
-    # Calculate sentiment polarity for each text
-    sentiments = [TextBlob(text).sentiment.polarity for text in texts]
-    
-    # Compute and return the mean sentiment score
-    return float(np.mean(sentiments))
+    # Score each distinct text once and weight it by how often it occurs
+    return _sentiment_sum(Counter(texts).items()) / len(texts)
 
 def _score_thumbnail(thumbnail_url: str) -> float:
     """
     Compute a 0–1 score for how "attractive" a thumbnail is.
     """
+    return _score_thumbnails([thumbnail_url])[0]
+
+def _score_thumbnails(thumbnail_urls: List[str], skip_failures: bool = False) -> List[Optional[float]]:
+    """
+    Compute 0–1 attractiveness scores for a batch of thumbnails with a single CLIP forward pass.
+    With skip_failures, a thumbnail that can't be downloaded or decoded is logged and scored
+    as None instead of failing the whole batch.
+    """
+    if not thumbnail_urls:
+        return []
     try:
-        logger.info(f"Scoring thumbnail: {thumbnail_url}")
-        img = _download_image(thumbnail_url)
+        logger.info(f"Scoring {len(thumbnail_urls)} thumbnail(s)")
 
-        texts = POSITIVE_PROMPTS + NEGATIVE_PROMPTS
-        inputs = processor(
-            images=img,
-            text=texts,
-            return_tensors="pt",
-            padding=True
-        )
-        
-        # Get and normalize features
-        img_feats = model.get_image_features(inputs["pixel_values"])
-        txt_feats = model.get_text_features(inputs["input_ids"])
-        img_feats = img_feats / img_feats.norm(dim=-1, keepdim=True)
-        txt_feats = txt_feats / txt_feats.norm(dim=-1, keepdim=True)
+        _, image_features, txt_feats, score_direction = _get_clip()
 
-        # similarity logits
-        logits = (img_feats @ txt_feats.T) / TEMPERATURE  # shape (1, N_prompts)
-        logits = logits.squeeze(0)  # shape (N_prompts,)
+        def fetch(url: str):
+            try:
+                data = _download_image_bytes(url)
+                # OpenCV's decode and resize release the GIL, so on CPU they overlap with the
+                # other downloads; on CUDA nvJPEG decodes the whole batch afterwards
+                return data if DEVICE == "cuda" else _decode_thumbnail(data)
+            except Exception as e:
+                if not skip_failures:
+                    raise
+                logger.error(f"Failed to fetch thumbnail {url}: {e}")
+                return None
 
-        # Debug: log a few values
-        for p, score in zip(texts, logits.tolist()):
-            logger.debug(f"  '{p}': {score:.3f}")
+        # Downloads are network-bound, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=min(16, len(thumbnail_urls))) as executor:
+            fetched = list(executor.map(fetch, thumbnail_urls))
+        kept = [i for i, item in enumerate(fetched) if item is not None]
 
-        n_pos = len(POSITIVE_PROMPTS)
-        pos_mean = logits[:n_pos].mean()
-        neg_mean = logits[n_pos:].mean()
-        diff = pos_mean - neg_mean
+        with torch.inference_mode():
+            # shape (N, 3, 224, 224)
+            if DEVICE == "cuda" and kept:
+                try:
+                    pixel_values = _gpu_pixel_values([fetched[i] for i in kept])
+                except Exception:
+                    if not skip_failures:
+                        raise
+                    # Find the undecodable thumbnails one at a time and keep the rest
+                    rows = []
+                    for i in kept:
+                        try:
+                            rows.append((i, _gpu_pixel_values([fetched[i]])))
+                        except Exception as e:
+                            logger.error(f"Failed to decode thumbnail {thumbnail_urls[i]}: {e}")
+                    kept = [i for i, _ in rows]
+                    pixel_values = torch.cat([row for _, row in rows]) if rows else None
+            elif kept:
+                pixel_values = _cpu_pixel_values([fetched[i] for i in kept])
 
-        # sigmoid normalization
-        score = torch.sigmoid(diff * SCALE).item()
-        logger.info(f"Thumbnail score → {score:.4f}")
-        return float(score)
+            scores = []
+            if kept:
+                # Only the image tower runs per thumbnail; text features are cached
+                if DEVICE == "cuda":
+                    img_feats = _padded_image_features(image_features, pixel_values)
+                else:
+                    img_feats = image_features(pixel_values)
+                img_feats = img_feats / img_feats.norm(dim=-1, keepdim=True)
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    # Debug: log a few similarity logits
+                    logits = (img_feats @ txt_feats.T) / TEMPERATURE  # shape (N, N_prompts)
+                    for p, score in zip(POSITIVE_PROMPTS + NEGATIVE_PROMPTS, logits[0].tolist()):
+                        logger.debug(f"  '{p}': {score:.3f}")
+
+                # positive mean minus negative mean per row, then sigmoid normalization
+                scores = torch.sigmoid(img_feats @ score_direction).tolist()  # shape (N,)
+
+        results = [None] * len(thumbnail_urls)
+        for i, score in zip(kept, scores):
+            logger.info(f"Thumbnail score {thumbnail_urls[i]} → {score:.4f}")
+            results[i] = float(score)
+        return results
 
     except Exception as e:
         logger.error(f"Failed to score thumbnail: {e}")
         raise Exception(f"Failed to score thumbnail: {str(e)}")
 
+@functools.lru_cache(maxsize=32)
+def _z_quantiles(confidence_level: float, interval_type: str) -> Tuple[float, ...]:
+    # Only a handful of confidence levels are used, so each Φ⁻¹ lookup is computed once
+    alpha = 1.0 - confidence_level
+    if interval_type == "lower":
+        return (float(ndtri(alpha)),)
+    if interval_type == "upper":
+        return (float(ndtri(confidence_level)),)
+    return tuple(ndtri([alpha / 2, 1 - alpha / 2]).tolist())
+
 def _predict_next_video_views(
     historical_views: List[int],
     confidence_level: float = 0.90,
@@ -133,30 +333,37 @@ def _predict_next_video_views(
     """
     if not historical_views:
         raise ValueError("Historical views list cannot be empty")
-    views = np.array(historical_views, dtype=float)
+    views = np.array(historical_views, dtype=np.float64)
     if np.any(views <= 0):
         raise ValueError("All view counts must be positive to fit a log‑normal")
 
-    # Fit a log‑normal: returns (shape, loc, scale)
-    shape, loc, scale = stats.lognorm.fit(views, floc=0)
+    # Fit a log‑normal with loc fixed at 0. The MLE has a closed form:
+    # mu and sigma are the mean and (population) std of log(views).
+    # The array is a fresh float64 copy, so log and centering run in place.
+    log_views = np.log(views, out=views)
+    mu = log_views.mean()
+    log_views -= mu
+    sigma = np.sqrt(np.dot(log_views, log_views) / log_views.size)
 
-    alpha = 1.0 - confidence_level
+    def quantiles() -> List[float]:
+        # Log‑normal inverse CDF: exp(mu + sigma * Φ⁻¹(q))
+        z = np.asarray(_z_quantiles(confidence_level, interval_type))
+        return np.exp(mu + sigma * z).tolist()
 
     if interval_type == "lower":
         # one‑sided lower: find the α‑quantile so P(X ≥ L)=confidence_level
-        L = stats.lognorm.ppf(alpha, shape, loc=loc, scale=scale)
-        return float(L), float("inf")
+        L, = quantiles()
+        return L, float("inf")
 
     elif interval_type == "upper":
         # one‑sided upper: find the confidence_level‑quantile so P(X ≤ U)=confidence_level
-        U = stats.lognorm.ppf(confidence_level, shape, loc=loc, scale=scale)
-        return float("-inf"), float(U)
+        U, = quantiles()
+        return float("-inf"), U
 
     elif interval_type == "two-sided":
-        # central interval: cut off α/2 in each tail
-        lower_q = stats.lognorm.ppf(alpha / 2, shape, loc=loc, scale=scale)
-        upper_q = stats.lognorm.ppf(1 - alpha / 2, shape, loc=loc, scale=scale)
-        return float(lower_q), float(upper_q)
+        # central interval: cut off α/2 in each tail (both bounds in one vectorized call)
+        lower_q, upper_q = quantiles()
+        return lower_q, upper_q
 
 # Load environment variables from .env file
 load_dotenv()
@@ -177,6 +384,43 @@ class YouTubeAPI:
 # Create a singleton instance
 youtube_api = YouTubeAPI()
 
+def _ttl_cache(ttl: int = 3600, maxsize: int = 4096):
+    """
+    In-process memoization with expiry, mirroring the 1 hour TTL of the tool-level caches.
+    Results are shared between callers, so they must not be mutated.
+    """
+    def decorator(func):
+        entries: Dict = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(args)
+                if entry is not None and entry[0] > now:
+                    return entry[1]
+            result = func(*args)
+            with lock:
+                if len(entries) >= maxsize:
+                    # Drop expired entries first, then the oldest ones
+                    expired = [key for key, (expires, _) in entries.items() if expires <= now]
+                    for key in expired or list(entries)[:maxsize // 4]:
+                        entries.pop(key, None)
+                entries[args] = (now + ttl, result)
+            return result
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+    return decorator
+
+# Channel identifier formats accepted by _resolve_channel_id
+_CHANNEL_ID_RE = re.compile(r'^UC[a-zA-Z0-9_-]{22}$')
+_YOUTUBE_URL_RE = re.compile(r'youtube\.com/(?:(?:c|channel|user)/|(?=@))([^/?#]+)')
+
+# ISO 8601 durations as returned by the YouTube API, e.g. "PT1H2M3S" or "P1DT2H"
+_ISO_DURATION_RE = re.compile(r'^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$')
+
 
 def _download_video(video_id: str, output_path: str, quality: str) -> str:
     try:
@@ -204,25 +448,22 @@ def _download_video(video_id: str, output_path: str, quality: str) -> str:
     except Exception as e:
         raise Exception(f"Error downloading video: {str(e)}")
     
+@_ttl_cache()
 def _resolve_channel_id(channel_identifier: str) -> str:
     try:
         # If it's already a channel ID (starts with UC), return it
-        if re.match(r'^UC[a-zA-Z0-9_-]{22}$', channel_identifier):
+        if _CHANNEL_ID_RE.match(channel_identifier):
             return channel_identifier
             
+        # If it's a URL, extract the channel ID, custom name, username or handle
+        url_match = _YOUTUBE_URL_RE.search(channel_identifier)
+        if url_match:
+            channel_identifier = url_match.group(1)
+            if _CHANNEL_ID_RE.match(channel_identifier):
+                return channel_identifier
+                
         # If it's a handle (starts with @), remove the @
-        if channel_identifier.startswith('@'):
-            channel_identifier = channel_identifier[1:]
-            
-        # If it's a URL, extract the handle
-        if 'youtube.com' in channel_identifier:
-            # Handle different URL formats
-            if '/c/' in channel_identifier:
-                channel_identifier = channel_identifier.split('/c/')[-1].split('/')[0]
-            elif '/channel/' in channel_identifier:
-                channel_identifier = channel_identifier.split('/channel/')[-1].split('/')[0]
-            elif '/user/' in channel_identifier:
-                channel_identifier = channel_identifier.split('/user/')[-1].split('/')[0]
+        channel_identifier = channel_identifier.lstrip('@')
                 
         # Search for the channel
         request = youtube_api.youtube.search().list(
@@ -241,6 +482,20 @@ def _resolve_channel_id(channel_identifier: str) -> str:
     except HttpError as e:
         raise Exception(f"Error resolving channel ID: {str(e)}")
     
+def _format_video_details(video: Dict) -> Dict:
+    return {
+        "id": video['id'],
+        "title": video['snippet']['title'],
+        "description": video['snippet']['description'],
+        "publishedAt": video['snippet']['publishedAt'],
+        "viewCount": int(video['statistics'].get('viewCount', 0)),
+        "likeCount": int(video['statistics'].get('likeCount', 0)),
+        "commentCount": int(video['statistics'].get('commentCount', 0)),
+        "duration": video['contentDetails']['duration'],
+        "thumbnails": video['snippet']['thumbnails']
+    }
+
+@_ttl_cache()
 def _fetch_video_details(video_id: str) -> Dict:
     try:
         request = youtube_api.youtube.videos().list(
@@ -252,18 +507,28 @@ def _fetch_video_details(video_id: str) -> Dict:
         if not response['items']:
             raise ValueError(f"Video not found: {video_id}")
         
-        video = response['items'][0]
-        return {
-            "id": video['id'],
-            "title": video['snippet']['title'],
-            "description": video['snippet']['description'],
-            "publishedAt": video['snippet']['publishedAt'],
-            "viewCount": int(video['statistics']['viewCount']),
-            "likeCount": int(video['statistics'].get('likeCount', 0)),
-            "commentCount": int(video['statistics'].get('commentCount', 0)),
-            "duration": video['contentDetails']['duration'],
-            "thumbnails": video['snippet']['thumbnails']
-        }
+        return _format_video_details(response['items'][0])
+    except HttpError as e:
+        raise Exception(f"Error fetching video details: {str(e)}")
+
+def _fetch_video_details_bulk(video_ids: List[str]) -> Dict[str, Dict]:
+    """
+    Fetch details for many videos using one videos.list call per 50 IDs (the API maximum).
+    Returns a video ID -> details mapping; unavailable videos are omitted.
+    """
+    try:
+        details = {}
+        for i in range(0, len(video_ids), 50):
+            request = youtube_api.youtube.videos().list(
+                part="snippet,statistics,contentDetails",
+                id=','.join(video_ids[i:i + 50])
+            )
+            response = request.execute()
+            
+            for video in response.get('items', []):
+                details[video['id']] = _format_video_details(video)
+        
+        return details
     except HttpError as e:
         raise Exception(f"Error fetching video details: {str(e)}")
     
@@ -283,18 +548,16 @@ def _search_youtube_channel_videos(channel_id: str, search_term: str, max_result
         if not response['items']:
             return []
         
-        # Get detailed information for each video
-        videos = []
-        for item in response['items']:
-            video_id = item['id']['videoId']
-            video_details = _fetch_video_details(video_id)
-            videos.append(video_details)
+        # Get detailed information for all videos in one request
+        video_ids = [item['id']['videoId'] for item in response['items']]
+        details = _fetch_video_details_bulk(video_ids)
         
-        return videos
+        return [details[video_id] for video_id in video_ids if video_id in details]
         
     except HttpError as e:
         raise Exception(f"Error searching channel videos: {str(e)}")
     
+@_ttl_cache()
 def _fetch_channel_info(channel_id: str) -> Dict:
     try:
         request = youtube_api.youtube.channels().list(
@@ -341,24 +604,24 @@ def _fetch_videos(channel_id: str, max_results: int = 10) -> List[Dict]:
         )
         response = request.execute()
         
-        videos = []
-        for item in response['items']:
-            video_id = item['contentDetails']['videoId']
-            video_details = _fetch_video_details(video_id)
-            videos.append(video_details)
+        # Get detailed information for all videos in one request
+        video_ids = [item['contentDetails']['videoId'] for item in response['items']]
+        details = _fetch_video_details_bulk(video_ids)
         
-        return videos
+        return [details[video_id] for video_id in video_ids if video_id in details]
     except HttpError as e:
         raise Exception(f"Error fetching videos: {str(e)}")
     
 def _fetch_comments(video_id: str, max_results: int = 25) -> List[Dict]:
-    comments: List[Dict] = []
+    # Preallocate the result list and fill it in place instead of growing it
+    comments: List[Dict] = [None] * max_results
+    count = 0
     next_page_token = None
 
     try:
-        while len(comments) < max_results:
+        while count < max_results:
             # fetch up to 100 per page (API limit), or however many you still need
-            batch_size = min(100, max_results - len(comments))
+            batch_size = min(100, max_results - count)
             request = youtube_api.youtube.commentThreads().list(
                 part="snippet",
                 videoId=video_id,
@@ -372,26 +635,29 @@ def _fetch_comments(video_id: str, max_results: int = 25) -> List[Dict]:
                 top = item.get('snippet', {}).get('topLevelComment', {})
                 snip = top.get('snippet', {})
 
-                # ensure we at least have an ID and text before appending
+                # ensure we at least have an ID and text before storing
                 comment_id = top.get('id')
                 text = snip.get('textDisplay')
                 if not comment_id or text is None:
                     continue
 
-                comments.append({
+                comments[count] = {
                     "id": comment_id,
                     "author": snip.get('authorDisplayName', 'Unknown'),
                     "text": text,
                     "likeCount": snip.get('likeCount', 0),
                     "publishedAt": snip.get('publishedAt')
-                })
+                }
+                count += 1
+                if count == max_results:
+                    break
 
             # prepare for next page (if any)
             next_page_token = response.get('nextPageToken')
             if not next_page_token:
                 break
 
-        return comments
+        return comments[:count]
 
     except HttpError as e:
         raise Exception(f"Error fetching comments: {e}")
@@ -432,41 +698,40 @@ def _search_youtube_channels(query: str, max_results: int = 5, min_subscribers:
         )
         response = request.execute()
         
-        # Track unique channels and their best performing video
-        channel_videos = {}  # channel_id -> (video_views, video_data)
-        
+        # Track unique channels and their best performing video (results are sorted by views)
+        best_videos = {}  # channel_id -> video_id
         for item in response.get('items', []):
-            video_id = item['id']['videoId']
             channel_id = item['snippet']['channelId']
-            
-            # Skip if we already have this channel
-            if channel_id in channel_videos:
-                continue
-                
-            # Get video statistics
-            video_request = youtube_api.youtube.videos().list(
-                part="statistics",
-                id=video_id
-            )
-            video_response = video_request.execute()
-            
-            if not video_response.get('items'):
-                continue
-                
-            video_data = video_response['items'][0]
-            view_count = int(video_data['statistics'].get('viewCount', 0))
-            
-            # Get channel statistics
-            channel_request = youtube_api.youtube.channels().list(
-                part="statistics,snippet",
-                id=channel_id
-            )
-            channel_response = channel_request.execute()
-            
-            if not channel_response.get('items'):
+            if channel_id not in best_videos:
+                best_videos[channel_id] = item['id']['videoId']
+        
+        if not best_videos:
+            return []
+        
+        # Get video statistics for all channels' best videos in one request
+        video_response = youtube_api.youtube.videos().list(
+            part="statistics",
+            id=','.join(best_videos.values())
+        ).execute()
+        view_counts = {
+            video['id']: int(video['statistics'].get('viewCount', 0))
+            for video in video_response.get('items', [])
+        }
+        
+        # Get channel statistics for all channels in one request
+        channel_response = youtube_api.youtube.channels().list(
+            part="statistics,snippet",
+            id=','.join(best_videos),
+            maxResults=50
+        ).execute()
+        
+        channel_videos = {}  # channel_id -> (video_views, video_data)
+        for channel_data in channel_response.get('items', []):
+            channel_id = channel_data['id']
+            view_count = view_counts.get(best_videos.get(channel_id))
+            if view_count is None:
                 continue
                 
-            channel_data = channel_response['items'][0]
             subscriber_count = int(channel_data['statistics'].get('subscriberCount', 0))
             
             # Only include channels that meet the subscriber threshold
@@ -526,77 +791,34 @@ def _fetch_video_statistics(channel_id: str, max_results: int = 10, months: int
         )
         stats_response = stats_request.execute()
         
+        if not stats_response.get('items'):
+            return []
+        
+        # Build one frame over all videos and let pandas/NumPy do the per-field parsing
+        df = pd.json_normalize(stats_response['items'])
+        
         # Calculate the cutoff date (X months ago)
-        from datetime import datetime, timedelta
-        cutoff_date = datetime.utcnow() - timedelta(days=30 * months)
+        cutoff_date = pd.Timestamp.now(tz="UTC") - pd.Timedelta(days=30 * months)
+        publish_dates = pd.to_datetime(df['snippet.publishedAt'], utc=True, errors='coerce')
         
-        # Process and filter statistics
-        video_stats = []
-        for video in stats_response['items']:
-            try:
-                # Parse publish date
-                publish_date = datetime.strptime(video['snippet']['publishedAt'], '%Y-%m-%dT%H:%M:%SZ')
-                
-                # Parse duration (ISO 8601 format)
-                duration_str = video.get('contentDetails', {}).get('duration', 'PT0S')  # Default to 0 seconds if duration is missing
-                duration_minutes = 0
-                
-                # Handle hours
-                if 'H' in duration_str:
-                    hours_part = duration_str.split('H')[0]
-                    if 'T' in hours_part:
-                        hours = int(hours_part.split('T')[1])
-                    else:
-                        hours = int(hours_part)
-                    duration_minutes += hours * 60
-                
-                # Handle minutes
-                if 'M' in duration_str:
-                    minutes_part = duration_str.split('M')[0]
-                    if 'H' in minutes_part:
-                        minutes = int(minutes_part.split('H')[-1])
-                    elif 'T' in minutes_part:
-                        minutes = int(minutes_part.split('T')[-1])
-                    else:
-                        minutes = int(minutes_part)
-                    duration_minutes += minutes
-                
-                # Handle seconds (convert to minutes if needed)
-                if 'S' in duration_str:
-                    seconds_part = duration_str.split('S')[0]
-                    if 'M' in seconds_part:
-                        seconds = int(seconds_part.split('M')[-1])
-                    elif 'H' in seconds_part:
-                        seconds = int(seconds_part.split('H')[-1])
-                    elif 'T' in seconds_part:
-                        seconds = int(seconds_part.split('T')[-1])
-                    else:
-                        seconds = int(seconds_part)
-                    duration_minutes += seconds / 60
-                
-                # Apply filters
-                if publish_date < cutoff_date or duration_minutes < min_duration_minutes:
-                    continue
-                    
-                stats = video.get('statistics', {})
-                video_stats.append({
-                    "videoId": video['id'],
-                    "viewCount": int(stats.get('viewCount', 0)),
-                    "likeCount": int(stats.get('likeCount', 0)),
-                    "commentCount": int(stats.get('commentCount', 0)),
-                    "favoriteCount": int(stats.get('favoriteCount', 0)),
-                    "durationMinutes": round(duration_minutes, 2),
-                    "publishedAt": video['snippet']['publishedAt']
-                })
-                
-                # Stop if we have enough videos
-                if len(video_stats) >= max_results:
-                    break
-            except Exception as e:
-                # Skip videos that cause errors
-                continue
+        # Parse duration (ISO 8601 format); default to 0 seconds if duration is missing
+        durations = df.get('contentDetails.duration', pd.Series('PT0S', index=df.index)).fillna('PT0S')
+        parts = durations.str.extract(_ISO_DURATION_RE).astype(float).fillna(0)
+        duration_minutes = (parts[0] * 24 + parts[1]) * 60 + parts[2] + parts[3] / 60
+        duration_minutes = duration_minutes.where(durations.str.match(_ISO_DURATION_RE))
+        
+        video_stats = pd.DataFrame({"videoId": df['id']})
+        for field in ('viewCount', 'likeCount', 'commentCount', 'favoriteCount'):
+            column = f'statistics.{field}'
+            video_stats[field] = pd.to_numeric(df[column], errors='coerce').fillna(0).astype(np.int64) if column in df else 0
+        video_stats["durationMinutes"] = duration_minutes.round(2)
+        video_stats["publishedAt"] = df['snippet.publishedAt']
+        
+        # Apply filters; NaT/NaN comparisons are False, so unparseable videos are skipped
+        keep = (publish_dates >= cutoff_date) & (duration_minutes >= min_duration_minutes)
+        video_stats = video_stats[keep].head(max_results)
         
-        return video_stats
+        return video_stats.to_dict("records")
     except HttpError as e:
         raise Exception(f"Error fetching video statistics: {str(e)}")
 
@@ -631,144 +853,159 @@ def _search_and_introspect_channel(query: str, video_count: int = 5) -> Dict:
         except Exception as e:
             return {"error": str(e)}
 
-def _video_to_text(video_id: str) -> str:
-    # Initialize Whisper model
-    model_size = "base"
-    whisper_model = whisper.load_model(model_size)
-    
-    # Download video with more reliable format options
+WHISPER_MODEL_SIZE = "base"
+AUDIO_SAMPLE_RATE = 16000  # Whisper expects 16 kHz mono audio
+_whisper_model = None
+_whisper_lock = threading.Lock()
+
+def _get_whisper_model() -> WhisperModel:
+    global _whisper_model
+    if _whisper_model is None:
+        with _whisper_lock:
+            if _whisper_model is None:
+                logger.info(f"Loading Whisper model {WHISPER_MODEL_SIZE}…")
+                # CTranslate2 backend: INT8 weights on CPU, FP16 on GPU
+                compute_type = "float16" if DEVICE == "cuda" else "int8"
+                _whisper_model = WhisperModel(WHISPER_MODEL_SIZE, device=DEVICE, compute_type=compute_type)
+    return _whisper_model
+
+def _extract_audio_info(video_id: str) -> Dict:
+    # Resolve metadata and the direct audio stream URL without downloading anything
     ydl_opts = {
-        'format': 'bestaudio/best',  # Changed from 'best[ext=mp4]' to be more flexible
-        'outtmpl': f'{tempfile.gettempdir()}/%(id)s.%(ext)s',
-        'quiet': False,
-        'no_warnings': False,
-        'progress': True
+        'format': 'bestaudio[ext=m4a]/bestaudio/best',
+        'quiet': True,
+        'no_warnings': True
     }
     
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         url = f"https://www.youtube.com/watch?v={video_id}"
-        info = ydl.extract_info(url, download=True)
-        video_path = f"{tempfile.gettempdir()}/{video_id}.{info['ext']}"
+        return ydl.extract_info(url, download=False)
+
+def _load_audio_stream(info: Dict) -> np.ndarray:
+    """
+    Decode the selected audio stream straight from its URL into 16 kHz mono float32 PCM,
+    piping ffmpeg's output into memory instead of going through a temporary file.
+    """
+    cmd = ["ffmpeg", "-nostdin", "-loglevel", "error"]
+    headers = "".join(f"{key}: {value}\r\n" for key, value in info.get('http_headers', {}).items())
+    if headers:
+        cmd += ["-headers", headers]
+    cmd += ["-i", info['url'], "-ac", "1", "-ar", str(AUDIO_SAMPLE_RATE), "-f", "s16le", "-"]
+    
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to decode audio: {result.stderr.decode(errors='ignore')}")
     
+    return np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
+
+def _transcribe(info: Dict) -> str:
+    audio = _load_audio_stream(info)
+    # Greedy decoding; the VAD filter skips silent stretches before they reach the model
+    segments, _ = _get_whisper_model().transcribe(audio, beam_size=1, vad_filter=True)
+    return " ".join(segment.text.strip() for segment in segments)
+
+def _video_to_text(video_id: str) -> str:
+    return _transcribe(_extract_audio_info(video_id))
+
+def _analyze_scene(scene_text: str) -> Dict:
+    # Agents keep per-run state, so each concurrent scene gets its own instance
+    scene_analyzer = Agent(
+        name="Scene Analyzer",
+        role="Analyze video scenes for content and sponsor mentions",
+        # JSON mode guarantees a parseable object, so no code fences or Python literals
+        model=OpenAIChat(id="gpt-4.1-mini", request_params={"response_format": {"type": "json_object"}}),
+        instructions=[
+            "Analyze the given scene text and provide:",
+            "1. A brief, informative summary of what was discussed in the scene",
+            "2. If any sponsor/brand was mentioned in this specific scene, return the sponsor name",
+            "3. If no sponsor was mentioned, return an empty string",
+            "Return the response in JSON format with 'summary' and 'sponsor' fields.",
+            "Return STRICT JSON, no code fences."
+        ]
+    )
+    
+    # Get scene analysis from LLM
+    scene_analysis = scene_analyzer.run(f"Scene text: {scene_text}")
+    
+    # Parse the LLM response
     try:
-        # Transcribe the video
-        result = whisper_model.transcribe(video_path)
-        
-        # Clean up the downloaded video
-        os.remove(video_path)
-        
-        return result["text"]
-    except Exception as e:
-        # Clean up in case of error
-        if os.path.exists(video_path):
-            os.remove(video_path)
-        raise e
+        analysis_data = json.loads(scene_analysis.content)
+        summary = analysis_data.get('summary', '')
+        sponsor = analysis_data.get('sponsor', '')
+    except (json.JSONDecodeError, TypeError, AttributeError):
+        # Fallback in case of parsing error
+        summary = scene_text.split('.')[0][:50] + '...'
+        sponsor = ''
+    
+    return {'summary': summary, 'sponsor': sponsor}
+
+def _detect_sponsors(description: str) -> List[Dict]:
+    # Use Agno agent with GPT-4.1-mini for overall sponsor detection
+    sponsor_agent = Agent(
+        name="Sponsor Detector",
+        role="Detect sponsors from video descriptions",
+        model=OpenAIChat(id="gpt-4.1-mini"),
+        instructions=[
+            "Analyze the video description and list all sponsors/brands mentioned.",
+            "Return only a comma-separated list of sponsor names, nothing else.",
+            "Be precise and only include actual sponsors, not just mentioned brands."
+        ]
+    )
+    
+    sponsor_response = sponsor_agent.run(f"Video description: {description}")
+    
+    # Parse sponsor response
+    sponsors = []
+    if sponsor_response and sponsor_response.content:
+        sponsor_names = sponsor_response.content.strip().split(',')
+        sponsors = [{'name': name.strip()} for name in sponsor_names if name.strip()]
+    return sponsors
     
 def _analyze_video_content(video_id: str) -> Dict:
     try:
-        # Get video transcription
-        transcription = _video_to_text(video_id)
+        # Get video metadata and transcription from a single extraction
+        info = _extract_audio_info(video_id)
+        transcription = _transcribe(info)
+        description = info.get('description', '')
+        title = info.get('title', '')
         
-        # Download video for metadata with the same format settings that work
-        ydl_opts = {
-            'format': 'bestaudio/best',  # Using the same format that works in _video_to_text
-            'outtmpl': f'{tempfile.gettempdir()}/%(id)s.%(ext)s',
-            'quiet': False,
-            'no_warnings': False,
-            'progress': True
-        }
+        # Split transcription into 60-second scenes
+        # Assuming average speaking rate of 150 words per minute
+        words = transcription.split()
+        words_per_scene = 150  # 150 words per minute
+        scene_texts = [' '.join(words[i:i + words_per_scene]) for i in range(0, len(words), words_per_scene)]
         
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            url = f"https://www.youtube.com/watch?v={video_id}"
-            info = ydl.extract_info(url, download=True)
-            video_path = f"{tempfile.gettempdir()}/{video_id}.{info['ext']}"
-            description = info.get('description', '')
-            title = info.get('title', '')
+        # The LLM calls are independent and I/O-bound, so run the scenes and the
+        # description-level sponsor detection concurrently
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sponsors_future = executor.submit(_detect_sponsors, description)
+            scene_results = list(executor.map(_analyze_scene, scene_texts))
+            sponsors = sponsors_future.result()
         
-        try:
-            # Split transcription into 60-second scenes
-            # Assuming average speaking rate of 150 words per minute
-            words = transcription.split()
-            words_per_scene = 150  # 150 words per minute
-            scenes = []
-            
-            # Create an agent for scene analysis
-            scene_analyzer = Agent(
-                name="Scene Analyzer",
-                role="Analyze video scenes for content and sponsor mentions",
-                model=OpenAIChat(id="gpt-4.1-mini"),
-                instructions=[
-                    "Analyze the given scene text and provide:",
-                    "1. A brief, informative summary of what was discussed in the scene",
-                    "2. If any sponsor/brand was mentioned in this specific scene, return the sponsor name",
-                    "3. If no sponsor was mentioned, return an empty string",
-                    "Return the response in JSON format with 'summary' and 'sponsor' fields."
-                ]
-            )
-            
-            for i in range(0, len(words), words_per_scene):
-                scene_words = words[i:i + words_per_scene]
-                scene_text = ' '.join(scene_words)
-                
-                # Get scene analysis from LLM
-                scene_analysis = scene_analyzer.run(f"Scene text: {scene_text}")
-                
-                # Parse the LLM response
-                try:
-                    analysis_data = eval(scene_analysis.content)  # Convert string to dict
-                    summary = analysis_data.get('summary', '')
-                    sponsor = analysis_data.get('sponsor', '')
-                except:
-                    # Fallback in case of parsing error
-                    summary = scene_text.split('.')[0][:50] + '...'
-                    sponsor = ''
-                
-                scenes.append({
-                    'start': i // words_per_scene * 60,
-                    'end': (i // words_per_scene + 1) * 60,
-                    'sponsor': sponsor
-                })
-            
-            # Use Agno agent with GPT-4.1-mini for overall sponsor detection
-            sponsor_agent = Agent(
-                name="Sponsor Detector",
-                role="Detect sponsors from video descriptions",
-                model=OpenAIChat(id="gpt-4.1-mini"),
-                instructions=[
-                    "Analyze the video description and list all sponsors/brands mentioned.",
-                    "Return only a comma-separated list of sponsor names, nothing else.",
-                    "Be precise and only include actual sponsors, not just mentioned brands."
-                ]
-            )
-            
-            sponsor_response = sponsor_agent.run(f"Video description: {description}")
-            
-            # Parse sponsor response
-            sponsors = []
-            if sponsor_response and sponsor_response.content:
-                sponsor_names = sponsor_response.content.strip().split(',')
-                sponsors = [{'name': name.strip()} for name in sponsor_names if name.strip()]
-            
-            return {
-                "scenes": scenes,
-                "sponsors": sponsors,
-                "metadata": {
-                    "title": title,
-                    "description": description
-                }
+        scenes = [
+            {
+                'start': index * 60,
+                'end': (index + 1) * 60,
+                'sponsor': result['sponsor']
             }
-            
-        finally:
-            # Clean up the downloaded video
-            if os.path.exists(video_path):
-                os.remove(video_path)
+            for index, result in enumerate(scene_results)
+        ]
+        
+        return {
+            "scenes": scenes,
+            "sponsors": sponsors,
+            "metadata": {
+                "title": title,
+                "description": description
+            }
+        }
                 
     except Exception as e:
         raise Exception(f"Failed to analyze video content: {str(e)}")
 
 @tool(
     name="sentiment_score",
-    description="Calculate the average sentiment score for text using TextBlob's sentiment analysis.",
+    description="Calculate the average sentiment score for text using VADER sentiment analysis.",
     show_result=True,
     cache_results=True,
     cache_ttl=3600,
@@ -782,7 +1019,7 @@ def sentiment_score(
     """]
 ) -> float:
     """
-    Calculate the average sentiment score for a single text or a list of texts using TextBlob.
+    Calculate the average sentiment score for a single text or a list of texts using VADER.
     The sentiment score ranges from -1.0 (most negative) to 1.0 (most positive).
     """
     return _sentiment_score(texts)
@@ -807,6 +1044,27 @@ def score_thumbnail(
     """
     return _score_thumbnail(thumbnail_url)
 
+@tool(
+    name="score_thumbnails_batch",
+    description="Analyzes several YouTube video thumbnails at once and returns a visual appeal score for each, in the same order (null for thumbnails that could not be loaded).",
+    show_result=True,
+    cache_results=True,
+    cache_ttl=3600,
+    cache_dir="/tmp/agno_cache"
+)
+def score_thumbnails_batch(
+    thumbnail_urls: Annotated[List[str], """
+        The URLs of the YouTube video thumbnails to analyze.
+        Each should be a direct URL to the image file.
+        Example: ['https://i.ytimg.com/vi/dQw4w9WgXcQ/maxresdefault.jpg', 'https://i.ytimg.com/vi/9bZkp7q19f0/hqdefault.jpg']
+    """]
+) -> List[Optional[float]]:
+    """
+    Compute 0–1 "attractiveness" scores for a list of thumbnails, downloading them concurrently
+    and scoring them in a single batch. A thumbnail that can't be fetched or decoded gets None.
+    """
+    return _score_thumbnails(thumbnail_urls, skip_failures=True)
+
 @tool(
     name="predict_next_video_views",
     description="Predict view count ranges for the next video based on historical view data using a log-normal model.",
@@ -838,13 +1096,304 @@ def predict_next_video_views(
     """
     return _predict_next_video_views(historical_views, confidence_level, interval_type)
 
-def _crawl_talent_agency(agency_url: str, limit: int = 20) -> Dict:
+@functools.lru_cache(maxsize=1)
+def _get_firecrawl() -> FirecrawlApp:
+    # One client per process so repeated crawls reuse its HTTP connection pool
+    return FirecrawlApp(api_key=os.getenv("FIRECRAWL_API_KEY"))
+
+# Concurrent crawl jobs allowed by the Firecrawl plan (each job scrapes its pages in parallel)
+_firecrawl_slots = threading.BoundedSemaphore(int(os.getenv("FIRECRAWL_CONCURRENCY", "2")))
+
+def _normalize_url(url: str) -> str:
+    # Compare URLs regardless of scheme, "www." and trailing slash
+    return re.sub(r"^https?://(?:www\.)?", "", url.strip().lower()).rstrip("/")
+
+def _is_start_page(page, start_url: str) -> bool:
+    """
+    Whether a crawled page is the crawl's start URL. Firecrawl returns pages roughly in the
+    order they finish, so the start page is identified by its URL rather than its position.
+    """
+    metadata = page.metadata or {}
+    if isinstance(metadata, dict):
+        urls = [metadata.get("sourceURL"), metadata.get("url")]
+    else:
+        urls = [getattr(metadata, "sourceURL", None), getattr(metadata, "url", None)]
+    urls.append(getattr(page, "url", None))
+    return any(url and _normalize_url(url) == start_url for url in urls)
+
+def _run_crawl(
+    app: FirecrawlApp,
+    agency_url: str,
+    limit: int,
+    scrape_options: ScrapeOptions,
+    max_talents: Optional[int] = None
+):
+    """
+    Start an asynchronous crawl job and poll it until it finishes. Polling starts fast and
+    backs off exponentially, so small crawls return sooner than with a fixed interval.
+    
+    Pages scraped so far are scanned for social profile links on every poll. Links on the
+    start URL's page (matched by its metadata URL) are the agency's own profiles, so they
+    never count as talents. The crawl is cancelled early once max_talents profiles are found,
+    or, once the start page has been seen and talent profiles found, when two polls in a row
+    bring new pages but no new profiles (the roster has been seen).
+    """
+    with _firecrawl_slots:
+        job = app.async_crawl_url(agency_url, limit=limit, scrape_options=scrape_options)
+        if not job.success or not job.id:
+            raise Exception(f"Failed to start crawl: {job.error}")
+        
+        delay = 0.5
+        start_url = _normalize_url(agency_url)
+        seen_pages = 0
+        profile_links = {platform: set() for platform in _SOCIAL_RES}
+        agency_links = None
+        stale_polls = 0
+        while True:
+            status = app.check_crawl_status(job.id)
+            if status.status == "completed":
+                return status
+            if status.status in ("failed", "cancelled"):
+                raise Exception(f"Crawl {status.status}: {agency_url}")
+            
+            # Only the pages added since the last poll need scanning
+            new_pages = (status.data or [])[seen_pages:]
+            seen_pages += len(new_pages)
+            found_before = sum(len(links) for links in profile_links.values())
+            start_page_arrived = False
+            for page in new_pages:
+                page_links = {
+                    platform: link_re.findall(page.markdown or "") for platform, link_re in _SOCIAL_RES.items()
+                }
+                if agency_links is None and _is_start_page(page, start_url):
+                    # Retroactively drop the agency's own profiles counted from earlier pages
+                    agency_links = {link for links in page_links.values() for link in links}
+                    for links in profile_links.values():
+                        links -= agency_links
+                    start_page_arrived = True
+                    continue
+                for platform, links in page_links.items():
+                    profile_links[platform].update(link for link in links if link not in (agency_links or ()))
+            found = sum(len(links) for links in profile_links.values())
+            # Until the start page is in, agency links can't be told apart, so no poll counts as stale
+            if agency_links is not None and new_pages and not start_page_arrived:
+                stale_polls = stale_polls + 1 if found and found == found_before else 0
+            
+            # A talent usually links several platforms, so the largest platform is the talent estimate
+            talents_found = max(len(links) for links in profile_links.values())
+            if (max_talents and talents_found >= max_talents) or stale_polls >= 2:
+                logger.info(f"Stopping crawl of {agency_url} early after {seen_pages} page(s)")
+                try:
+                    app.cancel_crawl(job.id)
+                except Exception as e:
+                    logger.warning(f"Failed to cancel crawl {job.id}: {e}")
+                return status
+            
+            time.sleep(delay)
+            delay = min(delay * 2, 8.0)
+
+# Firecrawl can return empty pages instead of an error when rate limited, so retry both
+# At least one attempt always runs, so _crawl_with_retries returns a result or raises
+FIRECRAWL_MAX_RETRIES = max(1, int(os.getenv("FIRECRAWL_MAX_RETRIES", "3")))
+FIRECRAWL_RETRY_BASE_DELAY = float(os.getenv("FIRECRAWL_RETRY_BASE_DELAY", "2.0"))
+
+def _is_rate_limited(error: Exception) -> bool:
+    response = getattr(error, "response", None)
+    if response is not None and response.status_code == 429:
+        return True
+    message = str(error).lower()
+    return "rate limit" in message or "status code 429" in message
+
+def _crawl_with_retries(
+    app: FirecrawlApp,
+    agency_url: str,
+    limit: int,
+    scrape_options: ScrapeOptions,
+    max_talents: Optional[int] = None
+):
+    """
+    Run the crawl, retrying with exponential backoff (base * 2^attempt) when Firecrawl
+    rate limits the request or returns no page content.
+    """
+    for attempt in range(FIRECRAWL_MAX_RETRIES):
+        is_last_attempt = attempt == FIRECRAWL_MAX_RETRIES - 1
+        try:
+            crawl_result = _run_crawl(app, agency_url, limit, scrape_options, max_talents)
+        except Exception as e:
+            if is_last_attempt or not _is_rate_limited(e):
+                raise
+            logger.warning(f"Firecrawl rate limited on {agency_url} (attempt {attempt + 1}): {e}")
+        else:
+            if is_last_attempt or any(page.markdown for page in crawl_result.data):
+                return crawl_result
+            logger.warning(f"Firecrawl returned no content for {agency_url} (attempt {attempt + 1})")
+        
+        time.sleep(FIRECRAWL_RETRY_BASE_DELAY * 2 ** attempt)
+
+# Contact details and social profile links are extracted from the markdown without the LLM
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]*[A-Za-z]")
+# Only numbers with real phone evidence count: a tel: link, or a leading +country code or
+# (area code). Separators never span lines, so dates, counts and digit runs don't match.
+_TEL_LINK_RE = re.compile(r"tel:(\+?[\d().%-]{6,}\d)")
+_PHONE_RE = re.compile(r"(?:\+\d{1,3}|\(\d{2,5}\))(?:[ \t().-]{0,2}\d){7,14}")
+_SOCIAL_RES = {
+    "youtube": re.compile(r"https?://(?:www\.|m\.)?youtube\.com/[^\s)\"'\]]+"),
+    "instagram": re.compile(r"https?://(?:www\.)?instagram\.com/[^\s)\"'\]]+"),
+    "tiktok": re.compile(r"https?://(?:www\.)?tiktok\.com/[^\s)\"'\]]+"),
+    "twitter": re.compile(r"https?://(?:www\.)?(?:twitter|x)\.com/[^\s)\"'\]]+")
+}
+# Retina image names such as logo@2x.png look like emails
+_IMAGE_EXT_RE = re.compile(r"\.(?:png|jpe?g|gif|svg|webp)$", re.IGNORECASE)
+
+def _extract_structured_fields(pages: List) -> Dict:
+    """
+    Collect the agency email, phone and all social profile links (per _SOCIAL_RES platform)
+    from the crawled pages. Values keep the order they first appear in.
+    """
+    emails, phones = {}, {}
+    social = {platform: {} for platform in _SOCIAL_RES}
+    for page in pages:
+        text = page.markdown or ""
+        emails.update(dict.fromkeys(e for e in _EMAIL_RE.findall(text) if not _IMAGE_EXT_RE.search(e)))
+        phones.update(dict.fromkeys(unquote(p) for p in _TEL_LINK_RE.findall(text)))
+        phones.update(dict.fromkeys(_PHONE_RE.findall(text)))
+        for platform, link_re in _SOCIAL_RES.items():
+            social[platform].update(dict.fromkeys(link_re.findall(text)))
+    return {
+        "email": next(iter(emails), None),
+        "phone": next(iter(phones), None),
+        "social": {platform: list(links) for platform, links in social.items()}
+    }
+
+def _name_slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", text.lower())
+
+def _match_profile_link(name: str, links: List[str]) -> Union[str, None]:
+    # A profile belongs to a talent only when one whole path segment is the talent's name,
+    # e.g. /@JaneDoe or /jane.doe, never a substring such as /theagency_banana for "Ana"
+    slug = _name_slug(name)
+    if not slug:
+        return None
+    for link in links:
+        path = re.split(r"[?#]", link.split("/", 3)[-1])[0]
+        if any(_name_slug(segment) == slug for segment in path.split("/")):
+            return link
+    return None
+
+def _apply_structured_fields(talent_data: Dict, fields: Dict) -> Dict:
+    contact = talent_data.get("agency_contact") or {}
+    contact["email"] = fields["email"] or contact.get("email")
+    contact["phone"] = fields["phone"] or contact.get("phone")
+    talent_data["agency_contact"] = contact
+    
+    for talent in talent_data.get("talents") or []:
+        social_links = talent.get("social_links") or {}
+        for platform, links in fields["social"].items():
+            # The parser's own link wins; regex matches only fill platforms it left empty
+            if social_links.get(platform):
+                continue
+            link = _match_profile_link(talent.get("name") or "", links)
+            if link:
+                social_links[platform] = link
+        talent["social_links"] = social_links
+    return talent_data
+
+# Pages are parsed in small chunks on a fixed pool, so prompts stay short and run in parallel
+PARSER_PAGES_PER_CHUNK = 4
+PARSER_CONCURRENCY = 4
+_parser_pool = ThreadPoolExecutor(max_workers=PARSER_CONCURRENCY, thread_name_prefix="talent-parser")
+
+# Response schema for the parser agent, enforced through OpenAI structured outputs.
+# Every field is required (nullable where the site may not say), as strict mode expects.
+class AgencyContact(BaseModel):
+    address: Optional[str] = Field(..., description="Agency postal address")
+
+class SocialLinks(BaseModel):
+    youtube: Optional[str] = Field(..., description="YouTube channel URL")
+    instagram: Optional[str] = Field(..., description="Instagram profile URL")
+    other: Optional[str] = Field(..., description="Any other social media or website URL")
+
+class Talent(BaseModel):
+    name: str = Field(..., description="Talent's name")
+    social_links: SocialLinks
+    bio: Optional[str] = Field(..., description="Brief bio (1-2 sentences)")
+
+class AgencyPayload(BaseModel):
+    agency_name: Optional[str] = Field(..., description="Name of the talent agency")
+    agency_contact: AgencyContact
+    talents: List[Talent]
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_client() -> OpenAIClient:
+    # The OpenAI client is thread-safe, so every parser run shares its HTTP connection pool
+    return OpenAIClient()
+
+def _build_parser_agent(model_id: str = "gpt-4.1-mini") -> Agent:
+    # Agents keep per-run state and remember every run's messages, so each run gets a
+    # fresh one; only the underlying client is reused
+    return Agent(
+        name="Talent Parser",
+        role="Parse talent agency website content to extract talent information",
+        model=OpenAIChat(id=model_id, client=_get_openai_client()),
+        response_model=AgencyPayload,
+        instructions=[
+            "Extract the following information from the website content:",
+            "1. Agency name",
+            "2. Agency postal address",
+            "3. List of talents with:",
+            "   - Name",
+            "   - Social media links (YouTube, Instagram, etc.)",
+            "   - Brief bio (1-2 sentences)",
+            "Use null for any field the website does not mention."
+        ]
+    )
+
+def _parse_talent_chunk(website_content: str) -> Union[Dict, None]:
+    parsed_content = _build_parser_agent().run(f"Website content: {website_content}")
+    # The model's output is validated against AgencyPayload; agno leaves the raw text if it isn't
+    if isinstance(parsed_content.content, AgencyPayload):
+        return parsed_content.content.model_dump()
+    return None
+
+def _merge_talent_chunks(chunks: List[Union[Dict, None]]) -> Union[Dict, None]:
+    """
+    Merge per-chunk results: the first non-empty value of each agency field wins, talents are
+    concatenated and a talent seen on several pages is collapsed into one entry.
+    """
+    parsed = [chunk for chunk in chunks if isinstance(chunk, dict)]
+    if not parsed:
+        return None
+    
+    merged = {"agency_name": None, "agency_contact": {}, "talents": []}
+    talents_by_name = {}
+    for chunk in parsed:
+        merged["agency_name"] = merged["agency_name"] or chunk.get("agency_name")
+        # Contact dicts always have every key (often None), so merge them field by field
+        for field, value in (chunk.get("agency_contact") or {}).items():
+            merged["agency_contact"][field] = merged["agency_contact"].get(field) or value
+        for talent in chunk.get("talents") or []:
+            key = _name_slug(talent.get("name") or "")
+            existing = talents_by_name.get(key) if key else None
+            if existing is None:
+                if key:
+                    talents_by_name[key] = talent
+                merged["talents"].append(talent)
+                continue
+            existing["bio"] = existing.get("bio") or talent.get("bio")
+            existing_links = existing.get("social_links") or {}
+            for platform, link in (talent.get("social_links") or {}).items():
+                existing_links[platform] = existing_links.get(platform) or link
+            existing["social_links"] = existing_links
+    return merged
+
+def _crawl_talent_agency(agency_url: str, limit: int = 20, max_talents: Optional[int] = None) -> Dict:
     """
     Crawl a talent agency website to extract information about their talents/influencers.
     
     Args:
         agency_url (str): The URL of the talent agency website
         limit (int): Maximum number of pages to crawl (default: 50)
+        max_talents (Optional[int]): Stop crawling once this many talent profiles are found
         
     Returns:
         Dict: A dictionary containing:
@@ -857,73 +1406,49 @@ def _crawl_talent_agency(agency_url: str, limit: int = 20) -> Dict:
                 - stats: Dictionary of social media statistics
     """
     try:
-        
         # Initialize Firecrawl
-        app = FirecrawlApp(api_key=os.getenv("FIRECRAWL_API_KEY"))
+        app = _get_firecrawl()
         
-        # Configure scraping options
+        # Configure scraping options (the parser only reads markdown, so skip the HTML payload)
         scrape_options = ScrapeOptions(
-            formats=['markdown', 'html'],
+            formats=['markdown'],
             onlyMainContent=True,
-            excludeTags=['script', 'style', 'nav', 'footer', 'header']
+            excludeTags=['script', 'style', 'nav', 'footer', 'header', 'img', 'svg', 'iframe'],
+            # Skip ads and inlined images and don't wait on slow pages (timeout is in ms)
+            blockAds=True,
+            removeBase64Images=True,
+            waitFor=0,
+            timeout=15000
         )
         
         # Crawl the website
-        crawl_result = app.crawl_url(
-            agency_url,
-            limit=limit,
-            scrape_options=scrape_options
-        )
-        
-        # Create an agent to parse the crawled content
-        parser_agent = Agent(
-            name="Talent Parser",
-            role="Parse talent agency website content to extract talent information",
-            model=OpenAIChat(id="gpt-4.1-mini"),
-            instructions=[
-                "Extract the following information from the website content:",
-                "1. Agency name",
-                "2. Agency contact information (email, phone, address)",
-                "3. List of talents with:",
-                "   - Name",
-                "   - Social media links (YouTube, Instagram, etc.)",
-                "   - Brief bio (1-2 sentences)",
-                "Return the data in this JSON format:",
-                "{",
-                "  'agency_name': 'string',",
-                "  'agency_contact': {",
-                "    'email': 'string',",
-                "    'phone': 'string',",
-                "    'address': 'string'",
-                "  },",
-                "  'talents': [",
-                "    {",
-                "      'name': 'string',",
-                "      'social_links': {",
-                "        'youtube': 'string',",
-                "        'instagram': 'string',",
-                "        'other': 'string'",
-                "      },",
-                "      'bio': 'string'",
-                "    }",
-                "  ]",
-                "}"
-            ]
-        )
+        crawl_result = _crawl_with_retries(app, agency_url, limit, scrape_options, max_talents)
+        if not any(page.markdown for page in crawl_result.data):
+            # Nothing to parse, so don't spend an LLM call on it
+            return {
+                "error": "No content could be crawled from the agency website",
+                "raw_content": crawl_result
+            }
         
-        # Parse the crawled content
-        parsed_content = parser_agent.run(f"Website content: {crawl_result}")
+        # Email, phone and profile links come from regexes; the LLM only handles names, bios and address
+        structured_fields = _extract_structured_fields(crawl_result.data)
+        markdown_pages = [page.markdown for page in crawl_result.data if page.markdown]
+        website_chunks = [
+            "\n\n".join(markdown_pages[i:i + PARSER_PAGES_PER_CHUNK])
+            for i in range(0, len(markdown_pages), PARSER_PAGES_PER_CHUNK)
+        ]
         
-        try:
-            # Convert string response to dictionary
-            talent_data = eval(parsed_content.content)
-            return talent_data
-        except:
+        # Parse the crawled content chunk by chunk
+        talent_data = _merge_talent_chunks(list(_parser_pool.map(_parse_talent_chunk, website_chunks)))
+        if talent_data is None:
             # Fallback in case of parsing error
             return {
                 "error": "Failed to parse talent information",
                 "raw_content": crawl_result
             }
+        
+        talent_data = _apply_structured_fields(talent_data, structured_fields)
+        return talent_data
             
     except Exception as e:
         raise Exception(f"Error crawling talent agency: {str(e)}")
\ No newline at end of file
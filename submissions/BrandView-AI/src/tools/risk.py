@@ -5,7 +5,7 @@ from src.tools.helper.helper import _sentiment_score
 
 @tool(
     name="sentiment_score",
-    description="Calculate the average sentiment score for text using TextBlob's sentiment analysis.",
+    description="Calculate the average sentiment score for text using VADER sentiment analysis.",
     show_result=True,
     cache_results=True,
     cache_ttl=3600,
@@ -19,7 +19,7 @@ def sentiment_score(
     """]
 ) -> float:
     """
-    Calculate the average sentiment score for a single text or a list of texts using TextBlob.
+    Calculate the average sentiment score for a single text or a list of texts using VADER.
     The sentiment score ranges from -1.0 (most negative) to 1.0 (most positive).
     
     Args:
@@ -30,9 +30,9 @@ def sentiment_score(
         
     Example:
         >>> sentiment_score("Great video!")
-        0.8
+        0.6588
         >>> comments = ["Great video!", "This was terrible", "I learned a lot"]
         >>> sentiment_score(comments)
-        -0.06666666666666667
+        0.06070000000000001
     """
     return _sentiment_score(texts)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Dict, Annotated
+from typing import Dict, Annotated, Optional
 from agno.tools import tool
 from agno.tools.tavily import TavilyTools
 from src.tools.helper.helper import _crawl_talent_agency
@@ -20,7 +20,11 @@ def crawl_talent_agency(
     limit: Annotated[int, """
         Maximum number of pages to crawl on the website.
         Default is 50. Higher values will take longer but may find more talents.
-    """] = 50
+    """] = 50,
+    max_talents: Annotated[Optional[int], """
+        Stop crawling early once this many talent profiles have been found.
+        Default is None (crawl until the roster stops growing or the page limit is reached).
+    """] = None
 ) -> Dict:
     """
     Crawl a talent agency website to extract information about their talents/influencers.
@@ -28,6 +32,7 @@ def crawl_talent_agency(
     Args:
         agency_url (str): The URL of the talent agency website
         limit (int): Maximum number of pages to crawl (default: 50)
+        max_talents (Optional[int]): Stop crawling once this many talent profiles are found
         
     Returns:
         Dict: A dictionary containing:
@@ -39,4 +44,4 @@ def crawl_talent_agency(
                 - categories: List of talent categories
                 - stats: Dictionary of social media statistics
     """
-    return _crawl_talent_agency(agency_url, limit)
\ No newline at end of file
+    return _crawl_talent_agency(agency_url, limit, max_talents)
\ No newline at end of file
@@ -1,49 +1,6 @@
-import logging
-import requests
-from io import BytesIO
-from PIL import Image
-import torch
-import numpy as np
-from transformers import CLIPProcessor, CLIPModel
-import torch.nn.functional as F
-from typing import Annotated
+from typing import Annotated, List, Optional
 from agno.tools import tool
-from src.tools.helper.helper import _score_thumbnail
-
-# ─── Logging setup ─────────────────────────────────────────────────────────────
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-# Initialize CLIP model and processor globally
-CLIP_MODEL_NAME = "openai/clip-vit-large-patch14"
-logger.info(f"Loading CLIP model {CLIP_MODEL_NAME}…")
-model = CLIPModel.from_pretrained(CLIP_MODEL_NAME)
-processor = CLIPProcessor.from_pretrained(CLIP_MODEL_NAME)
-
-# Global parameters
-TEMPERATURE = 0.07
-SCALE = 5.0
-
-# Prompts covering design, clarity, emotion, composition
-POSITIVE_PROMPTS = [
-    "eye-catching thumbnail",
-    "bold, vibrant colors",
-    "clear, readable text",
-    "prominent faces",
-    "professional design"
-]
-NEGATIVE_PROMPTS = [
-    "blurry or out of focus",
-    "dark or underexposed",
-    "dull colors",
-    "small or unreadable text",
-    "cluttered layout"
-]
-
-def _download_image(url: str) -> Image.Image:
-    resp = requests.get(url, timeout=5)
-    resp.raise_for_status()
-    return Image.open(BytesIO(resp.content)).convert("RGB")
+from src.tools.helper.helper import _score_thumbnail, _score_thumbnails
 
 @tool(
     name="score_thumbnail",
@@ -63,4 +20,25 @@ def score_thumbnail(
     """
     Compute a 0–1 score for how "attractive" a thumbnail is.
     """
-    return _score_thumbnail(thumbnail_url)
\ No newline at end of file
+    return _score_thumbnail(thumbnail_url)
+
+@tool(
+    name="score_thumbnails_batch",
+    description="Analyzes several YouTube video thumbnails at once and returns a visual appeal score for each, in the same order (null for thumbnails that could not be loaded).",
+    show_result=True,
+    cache_results=True,
+    cache_ttl=3600,
+    cache_dir="/tmp/agno_cache"
+)
+def score_thumbnails_batch(
+    thumbnail_urls: Annotated[List[str], """
+        The URLs of the YouTube video thumbnails to analyze.
+        Each should be a direct URL to the image file.
+        Example: ['https://i.ytimg.com/vi/dQw4w9WgXcQ/maxresdefault.jpg', 'https://i.ytimg.com/vi/9bZkp7q19f0/hqdefault.jpg']
+    """]
+) -> List[Optional[float]]:
+    """
+    Compute 0–1 "attractiveness" scores for a list of thumbnails, downloading them concurrently
+    and scoring them in a single batch. A thumbnail that can't be fetched or decoded gets None.
+    """
+    return _score_thumbnails(thumbnail_urls, skip_failures=True)
\ No newline at end of file
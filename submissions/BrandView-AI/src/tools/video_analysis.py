@@ -1,7 +1,6 @@
 import os
 import torch
 from typing import Dict, List, Optional, Tuple, Annotated, Callable, Any
-import whisper
 from transformers import AutoTokenizer, AutoModelForCausalLM
 import requests
 from pathlib import Path